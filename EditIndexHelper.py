@@ -1,13 +1,52 @@
 import argparse
+import concurrent.futures
+import copy
 import csv
+import functools
+import itertools
 import json
 import logging
+import multiprocessing
 import os
-import platform
 import pprint
 import re
 import subprocess
 import sys
+from collections import defaultdict
+from operator import itemgetter
+from pathlib import PurePosixPath
+
+try:
+    import av
+except ImportError:
+    av = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import cisv
+except ImportError:
+    cisv = None
+
+try:
+    import csvmonkey
+except ImportError:
+    csvmonkey = None
+
+_IS_WINDOWS = sys.platform == 'win32'
+# normalises windows backslashes in paths with str.translate
+_SLASH = str.maketrans('\\', '/')
+
+# this regex requires dot before counter, allows for after counter chars "bla.1001.crypto"
+NM_RE = re.compile(r"(?P<clean>.+)(?P<sep>\.)(?P<counter>[0-9]+)(?P<after>.*)")
+_SEPS = frozenset('._-')
+# shorter timecode columns are converted line by line, numpy setup is not worth it
+_TC_VECTOR_MIN_ROWS = 100
+# smaller csv jobs are read in the main process, worker processes are not worth starting
+_CSV_POOL_MIN_BYTES = 32 * 1024 * 1024
 
 """
 Edit Index Helper
@@ -22,6 +61,7 @@ Use command line arguments for basics:
 -i to set root folder for Edit Index csv file(s).
 -m to set root folder for searching media files.
 -p to set custom path for prefs.json. See json _help items for more details
+-j to set number of parallel media metadata reads.
 Without any arguments, the above -i and -m options will be read from prefs.json file ath the main script location.
 
 Functionality
@@ -69,6 +109,237 @@ stream_handler.setFormatter(formatter)
 logger.addHandler(file_handler)
 logger.addHandler(stream_handler)
 
+@functools.lru_cache(maxsize=512)
+def _compile_cached(pattern):
+    """ compiles regex pattern once per process
+
+    :return:
+    compiled pattern, or None if the pattern is not valid
+    """
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        logger.error("Regex pattern {}\n{}".format(pattern, e))
+        return None
+
+
+class Default(dict):
+    """ keeps unknown {tokens} in the string when used with format_map """
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
+def regex_test_notokens(source, compiled, repl=''):
+    """ regex_test without tokens, for hot loops with already compiled pattern
+
+    :return:
+    first found group, or replace if repl is present
+    empty string if compiled is None
+    """
+    result = ''
+    if compiled is None:
+        return result
+    if source is None:
+        source = ''
+    if repl:
+        try:
+            result = compiled.sub(repl, source)
+        except:
+            pass
+    else:
+        m = compiled.search(source)
+        if m:
+            try:
+                result = m.group(1)
+            except:
+                pass
+    return result
+
+
+def _parse_rational(value):
+    """ parses ffprobe rationals like "24000/1001" or plain numbers like "25"
+
+    :return:
+    float, 0.0 if value is not a number or denominator is zero
+    """
+    value = str(value)
+    try:
+        if '/' in value:
+            num, den = value.split('/', 1)
+            den = float(den)
+            if den == 0:
+                return 0.0
+            return float(num) / den
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def _tc_column_to_frames_np(values, fps_float):
+    """ converts timecodes with numpy, all non empty values must be "hh:mm:ss:ff"
+
+    :return:
+    list of frames, None for empty values, or None if some timecode is not well formed
+    """
+    filled = [v for v in values if v]
+    if not filled or any(len(v) != 11 for v in filled):
+        return None
+    # one uint32 per character, minus '0'
+    digits = np.array(filled, dtype='U11').view(np.uint32).reshape(-1, 11).astype(np.int64) - ord('0')
+    if not (digits[:, [2, 5, 8]] == ord(':') - ord('0')).all():
+        return None
+    digits = digits[:, [0, 1, 3, 4, 6, 7, 9, 10]]
+    if ((digits < 0) | (digits > 9)).any():
+        return None
+    h, m, s, f = (digits[:, i] * 10 + digits[:, i + 1] for i in range(0, 8, 2))
+    fr_int = int(round(fps_float))
+    frames = iter(((h * 3600 + m * 60 + s) * fr_int + f).tolist())
+    return [next(frames) if v else None for v in values]
+
+
+def _tc_column_to_frames(values, fps_float):
+    """ converts a csv column of timecodes to frames, empty values give None
+    uses numpy for long columns, if installed
+    """
+    if np is not None and len(values) >= _TC_VECTOR_MIN_ROWS:
+        frames = _tc_column_to_frames_np(values, fps_float)
+        if frames is not None:
+            return frames
+    return [EditTool.tc_to_frames(v, fps_float) if v else None for v in values]
+
+
+def _process_row(row_values, fieldnames, tc_frames, line_number, skip_filters):
+    """ builds the final csv line dict in one pass
+
+    adds the timecode frames converted by columns, empty csv_key for matching
+    and csv_skip_line, tested by the (column index, compiled, repl, invert, equals) skip filters
+    column index is None if the column is not in the csv
+
+    :return:
+    line dict
+    """
+    line_dict = dict(zip(fieldnames, row_values))
+    for name, frames in tc_frames:
+        line_dict[name] = frames[line_number]
+    line_dict['csv_key'] = ''
+
+    line_dict['csv_skip_line'] = False
+    for col_idx, compiled, repl, invert, equals in skip_filters:
+        source = row_values[col_idx] if col_idx is not None else None
+        reg_test = regex_test_notokens(source, compiled, repl)
+        if reg_test and (equals != reg_test if invert else equals == reg_test):
+            # one matching filter is enough
+            line_dict['csv_skip_line'] = True
+            break
+    return line_dict
+
+
+def _make_filter(include, exclude, compiled_pattern):
+    """ builds file path filter for get_file_list
+    include and exclude are plain strings tested on full path, pattern is matched on file name
+
+    :return:
+    function returning True for accepted path, or None if there is nothing to filter
+    """
+    if not include and not exclude and compiled_pattern is None:
+        return None
+
+    def check(one_file):
+        # cheapest tests first
+        if include and include not in one_file:
+            return False
+        if exclude and exclude in one_file:
+            return False
+        if compiled_pattern is not None:
+            if not compiled_pattern.match(os.path.basename(one_file)):
+                logger.debug("Skip file %s due to pattern filter.", os.path.basename(one_file))
+                return False
+        return True
+
+    return check
+
+
+def _map_columns(header, rename_prefs):
+    """ renames csv header to internal names once per file
+
+    :return:
+    list of renamed field names, dict of field name to column index,
+    list of (frames field name, column index) for timecode columns
+    """
+    rename = {}
+    for target_name, csv_name in rename_prefs.items():
+        rename.setdefault(csv_name, target_name)
+    fieldnames = [rename.get(k, k) for k in header]
+    col_index = {k: idx for idx, k in enumerate(fieldnames)}
+    tc_columns = ["csv_sin", "csv_sout", "csv_rin", "csv_rout"]
+    tc_indices = [(k + '_frames', col_index[k]) for k in tc_columns if k in col_index]
+    return fieldnames, col_index, tc_indices
+
+
+def _read_one_csv_static(path, prefs_subset):
+    """ reads and processes one csv file
+    module level function, so it can run in a worker process
+
+    prefs_subset has 'rename' from csv_columns prefs,
+    'skip_filters' as (column, compiled, repl, invert, equals) and 'fps'
+
+    :return:
+    list of line dicts, number of not skipped lines
+    """
+    csv_listdict = []
+    valid_lines = 0
+    if not path or not os.path.exists(path):
+        return csv_listdict, valid_lines
+    try:
+        rows = _read_one_csv(path)
+    except IOError:
+        logger.error('Error opening csv file {}'.format(path))
+        return csv_listdict, valid_lines
+
+    header = rows[0] if rows else []
+    fieldnames, col_index, tc_indices = _map_columns(header, prefs_subset['rename'])
+    skip_filters = [(col_index.get(column), compiled, repl, invert, equals)
+                    for column, compiled, repl, invert, equals in prefs_subset['skip_filters']]
+    columns_count = len(fieldnames)
+    lines = [row for row in rows[1:] if row]
+    for row in lines:
+        if len(row) < columns_count:
+            row += [None] * (columns_count - len(row))
+    # timecodes are converted by whole columns
+    tc_frames = [(name, _tc_column_to_frames([row[idx] for row in lines], prefs_subset['fps']))
+                 for name, idx in tc_indices]
+    for line_number, row in enumerate(lines):
+        line_dict = _process_row(row, fieldnames, tc_frames, line_number, skip_filters)
+        if not line_dict['csv_skip_line']:
+            valid_lines += 1
+        csv_listdict.append(line_dict)
+    return csv_listdict, valid_lines
+
+
+def _read_one_csv(path):
+    """ reads all rows of a csv file, header row included
+
+    uses cisv or csvmonkey if installed, stdlib csv reader otherwise
+
+    :return:
+    list of rows, every row is a list of strings
+    """
+    if cisv is not None:
+        try:
+            return [list(row) for row in cisv.parse_file(path, delimiter=',')]
+        except Exception as e:
+            logger.debug("cisv failed to read %s, falling back.\n%s", path, e)
+    if csvmonkey is not None:
+        try:
+            rows = []
+            for row in csvmonkey.from_path(path, header=False, yields='tuple'):
+                rows.append([v.decode('utf-8') if isinstance(v, bytes) else v for v in row])
+            return rows
+        except Exception as e:
+            logger.debug("csvmonkey failed to read %s, falling back.\n%s", path, e)
+    with open(path, newline='') as csvfile:
+        return list(csv.reader(csvfile))
+
 
 class EditToolException(Exception):
     def __init__(self, msg):
@@ -79,52 +350,51 @@ class EditToolException(Exception):
 
 
 class EditTool:
-    def __init__(self, prefs, script_path):
+    def __init__(self, prefs, script_path, jobs=None):
         self.prefs = prefs
         self.script_path = script_path
+        # worker count for reading media metadata, ffprobe calls are I/O bound
+        self.jobs = jobs if jobs else (os.cpu_count() or 1) * 2
         self.csvs = {}
         self.csv_groups = {}
         self.media = {}
+        # edl path: number of events written
         self.edls = {}
+        # csv_key: list of (csv_file, line number, csv line), filled by prep_matching
+        self._key_index = {}
+
+        # patterns from prefs are compiled once, hot loops look them up by key
+        self._compiled = {
+            'csv_matching': _compile_cached(prefs['csv_matching']['csv_pattern']),
+            'media_matching': _compile_cached(prefs['csv_matching']['media_pattern']),
+            'group_common': _compile_cached(prefs['group_csv']['common']),
+            'group_sort': _compile_cached(prefs['group_csv']['sort']),
+            'edl_reel': _compile_cached(prefs['edl_reel']['pattern']),
+            'edl_clip': _compile_cached(prefs['edl_clip']['pattern']),
+            'edl_clip_path': _compile_cached(prefs['edl_clip_path']['pattern']),
+        }
 
     def regex_test(self, source, tokens, pattern, repl=''):
         """ takes source string, maps tokens,
          and uses regex pattern
+         pattern can be a string or already compiled pattern
 
         :return:
         first found group, or replace if repl is present
         """
 
-        class Default(dict):
-            def __missing__(self, key):
-                return '{' + key + '}'
+        if isinstance(pattern, str):
+            compiled = _compile_cached(pattern)
+        else:
+            compiled = pattern
 
-        regex_valid = False
-        compiled = None
-        try:
-            compiled = re.compile(pattern)
-            regex_valid = True
-        except re.error as e:
-            logger.error("Regex pattern {}\n{}".format(pattern, e))
-
-        filled_source = source.format_map(Default(tokens))
-        result = ''
-        if regex_valid:
-            if repl and repl != '':
-                try:
-                    result = re.sub(compiled, repl, filled_source)
-                except:
-                    pass
-            else:
-                m = compiled.search(filled_source)
-                if m:
-                    try:
-                        result = m.group(1)
-                    except:
-                        pass
-        return result
+        # no tokens or no fields in source, nothing to fill
+        if tokens and source and ('{' in source or '}' in source):
+            source = source.format_map(Default(tokens))
+        return regex_test_notokens(source, compiled, repl)
 
-    def tc_to_frames(self, tc, fps_float):
+    @staticmethod
+    def tc_to_frames(tc, fps_float):
 
         def _seconds(value, fr_int):
             _zip_ft = zip((3600, 60, 1, 1 / fr_int), value.split(':'))
@@ -136,18 +406,21 @@ class EditTool:
         fr_int = int(round(fps_float))
         return round(_frames(_seconds(tc, fr_int), fr_int))
 
-    def frames_to_tc(self, frames, fps_float):
+    @staticmethod
+    def frames_to_tc(frames, fps_float):
 
         fps = int(round(fps_float))
-        h = int(frames / (3600 * fps))
-        m = int(frames / (60 * fps)) % 60
-        s = int((frames % (60 * fps)) / fps)
-        f = frames % (60 * fps) % fps
-        return "{:02d}:{:02d}:{:02d}:{:02d}".format(h, m, s, f)
-
-    def parse_file_name(self, file_name):
+        total_secs, f = divmod(int(frames), fps)
+        total_mins, s = divmod(total_secs, 60)
+        h, m = divmod(total_mins, 60)
+        return f"{h:02d}:{m:02d}:{s:02d}:{f:02d}"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def parse_file_name(file_name):
         r"""
         Parses file path
+        Results are cached per path, so callers must not modify the returned dict
 
         Replaces backslashes with slashes to normalise windows schizofreny
         For unc paths like //host/mount/dir/fname.ext, parts will return '//' as first part
@@ -161,11 +434,7 @@ class EditTool:
         """
 
         # Replaces backslashes with slashes to normalise windows schizophrenia
-        fn = file_name.replace('\\', '/')
-        try:
-            filename = fn.decode("utf-8")
-        except:
-            filename = fn
+        filename = file_name.translate(_SLASH)
 
         seq = dict(full_path=filename, drive='', unc_host='', path='', name='', extension='', clean_name='',
                    number_string='', number=0, padding=0, clean_name_no_sep='', clean_name_sep_char='', parts=[],
@@ -176,16 +445,13 @@ class EditTool:
         seq['drive'], path = os.path.splitdrive(filename)
 
         # split path to directories and filename
-        seq['parts'] = []
-        while True:
-            newpath, tail = os.path.split(path)
-            if newpath == path:
-                assert not tail
-                if path: seq['parts'].append(path)
-                break
-            seq['parts'].append(tail)
-            path = newpath
-        seq['parts'].reverse()
+        # root is kept as the first part, repeated slashes inside the path are ignored
+        root = path[:len(path) - len(path.lstrip('/'))]
+        names = path[len(root):].split('/')
+        seq['parts'] = [root] if root else []
+        seq['parts'] += [n for n in names[:-1] if n]
+        if len(names) > 1 or names[0]:
+            seq['parts'].append(names[-1])
 
         seq['path'] = os.path.dirname(filename)
         seq['name'] = os.path.basename(filename)
@@ -200,8 +466,6 @@ class EditTool:
         else:
             seq["extension"] = seq["extension"][1:]
 
-        # this regex requires dot before counter, allows for after counter chars "bla.1001.crypto"
-        NM_RE = re.compile(r"(?P<clean>.+)(?P<sep>\.)(?P<counter>[0-9]+)(?P<after>.*)")
         m = NM_RE.search(seq["name"])
         if m is not None:
             seq["number_string"] = m.group("counter")
@@ -211,7 +475,7 @@ class EditTool:
 
             if m.group("clean") and m.group("sep"):
                 seq["clean_name"] = m.group("clean") + m.group("sep")
-            if m.group("sep") and m.group("sep") in ['.', '_', '-']:
+            if m.group("sep") and m.group("sep") in _SEPS:
                 seq["clean_name_no_sep"] = m.group("clean")
                 seq["clean_name_sep_char"] = m.group("sep")
             if m.group("after"):
@@ -222,9 +486,11 @@ class EditTool:
 
         return seq
 
-    def get_metadata(self, full_path):
+    @staticmethod
+    def get_metadata(full_path, ffprobe_path):
         """
-        reads metadata by ffprobe
+        reads metadata by PyAV if installed, by ffprobe otherwise
+        does not touch the tool instance, so it can run in worker threads
         """
         multi_frame_ext = ['mov', 'avi', 'mpg', 'mpeg', 'mp2', 'mpv',
                            'mp4', 'm4v', 'gov', 'qt', 'r3d', 'mxf']
@@ -253,7 +519,7 @@ class EditTool:
                 path_to_file (str): absolute path
             """
 
-            ffprobe = self.prefs['media_meta']['ffprobe_path']
+            ffprobe = ffprobe_path
             if ffprobe is None:
                 return None
 
@@ -273,7 +539,7 @@ class EditTool:
                 "stdout": subprocess.PIPE,
                 "stderr": subprocess.PIPE,
             }
-            if platform.system().lower() == "windows":
+            if _IS_WINDOWS:
                 kwargs["creationflags"] = (
                         subprocess.CREATE_NEW_PROCESS_GROUP
                         | getattr(subprocess, "DETACHED_PROCESS", 0)
@@ -281,24 +547,56 @@ class EditTool:
                 )
             popen = subprocess.Popen(ff_args, **kwargs)
             popen_stdout, popen_stderr = popen.communicate()
-            if popen_stdout:
-                pass
-            if popen_stderr:
-                pass
+            if popen.returncode != 0 or not popen_stdout:
+                logger.error(f"Ffprobe failed to read {path_to_file}\n{popen_stderr.decode(errors='replace')}")
+                return None
             return json.loads(popen_stdout)
 
+        def get_av_data(path_to_file):
+            """Load data about entered filepath via PyAV, without starting ffprobe process.
+            Returns the streams in the same shape as ffprobe json output.
+
+            Args:
+                path_to_file (str): absolute path
+            """
+
+            try:
+                with av.open(path_to_file) as container:
+                    streams = []
+                    tc = container.metadata.get('timecode')
+                    for s in container.streams:
+                        if tc is None:
+                            tc = s.metadata.get('timecode')
+                        if s.type != 'video':
+                            continue
+                        sar = s.sample_aspect_ratio
+                        rate = s.average_rate
+                        if s.duration is not None and s.time_base is not None:
+                            duration = float(s.duration * s.time_base)
+                        elif container.duration is not None:
+                            duration = container.duration / av.time_base
+                        else:
+                            duration = 0.0
+                        streams.append({
+                            'codec_type': 'video',
+                            'width': s.width,
+                            'height': s.height,
+                            'sample_aspect_ratio': f"{sar.numerator}:{sar.denominator}" if sar else "",
+                            'r_frame_rate': f"{rate.numerator}/{rate.denominator}" if rate else '0',
+                            'nb_frames': s.frames,
+                            'duration': duration
+                        })
+                    if tc is not None:
+                        streams.append({'codec_tag_string': 'tmcd', 'tags': {'timecode': tc}})
+            except Exception as e:
+                logger.error(f"PyAV failed to read {path_to_file}\n{e}")
+                return None
+            return {'streams': streams}
+
         def seconds_to_frames(seconds, fps):
 
             seconds = float(seconds)
-            try:
-                fps = float(fps)
-            except:
-                if '/' in fps:
-                    a = float(fps.split('/')[0])
-                    b = float(fps.split('/')[1])
-                    fps = float(a) / float(b)
-                else:
-                    fps = None
+            fps = _parse_rational(fps)
 
             if fps:
                 total_frames = round(fps * seconds)
@@ -308,7 +606,12 @@ class EditTool:
             return str(total_frames)
 
         metadata = {}
-        input_file_metadata = get_ffprobe_data(full_path)
+        if av is not None:
+            input_file_metadata = get_av_data(full_path)
+        else:
+            input_file_metadata = get_ffprobe_data(full_path)
+        if not input_file_metadata:
+            return metadata
         _s = input_file_metadata.get('streams')
         tc = None
         if _s:
@@ -319,7 +622,7 @@ class EditTool:
                     'height': int(stream.get("height", '0')),
                     'pa': str(stream.get("sample_aspect_ratio", "")),  # "1:1"
                     'fps_raw': str(stream.get("r_frame_rate", '0')),  # "24/1"
-                    'fps': float(eval(str(stream.get("r_frame_rate", '0')))), # 24.0
+                    'fps': _parse_rational(stream.get("r_frame_rate", '0')), # 24.0
                     'duration_frames': int(stream.get("nb_frames", '0')),
                     'duration_secs': float(stream.get("duration", '0.0')), # "38.333333" seconds
                     'category': get_category(full_path),
@@ -346,9 +649,9 @@ class EditTool:
 
             # calculate stc in stc out
             if metadata['duration_frames'] is not None and metadata['duration_frames'] != 0 and metadata['timecode'] is not None:
-                metadata['tc_in_frames'] = int(self.tc_to_frames(metadata['timecode'], fps))
+                metadata['tc_in_frames'] = int(EditTool.tc_to_frames(metadata['timecode'], fps))
                 metadata['tc_out_frames'] = metadata['tc_in_frames'] + int(metadata['duration_frames']) - 1
-                metadata['tc_out'] = str(self.frames_to_tc(metadata['tc_out_frames'], fps))
+                metadata['tc_out'] = str(EditTool.frames_to_tc(metadata['tc_out_frames'], fps))
 
         return metadata
 
@@ -360,24 +663,33 @@ class EditTool:
         file_list = []
         files = []
         if recursive:
-            files = [os.path.join(dirpath, f) for (dirpath, dirnames, filenames) in os.walk(root) for f in filenames]
+            # depth first, in the same order as os.walk, using the entry types cached by scandir
+            folders = [root]
+            while folders:
+                sub_folders = []
+                with os.scandir(folders.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            sub_folders.append(entry.path)
+                        elif entry.is_file():
+                            files.append(entry.path)
+                folders.extend(reversed(sub_folders))
         else:
-            files = os.listdir(root)
-            files = [root + '/' + f for f in files if os.path.isfile(root + '/' + f)]
+            with os.scandir(root) as entries:
+                files = [root + '/' + entry.name for entry in entries if entry.is_file()]
+
+        compiled_pattern = None
+        if pattern:
+            compiled_pattern = _compile_cached(pattern)
+            if compiled_pattern is None:
+                raise EditToolException("File pattern regex not valid: {}".format(pattern))
 
         if files and len(files) > 0:
-            for one_file in files:
-                if include != '' and include not in one_file:
-                    #print(f"Skip file {one_file} due to include filter.")
-                    continue
-                if exclude != '' and exclude in one_file:
-                    #print(f"Skip file {one_file} due to exclude filter.")
-                    continue
-                if pattern != '':
-                    if not bool(re.match(pattern, os.path.basename(one_file))):
-                        logger.debug(f"Skip file {os.path.basename(one_file)} due to pattern filter.")
-                        continue
-                file_list.append(one_file)
+            check = _make_filter(include, exclude, compiled_pattern)
+            if check is None:
+                file_list = list(files)
+            else:
+                file_list = [one_file for one_file in files if check(one_file)]
         else:
             logger.warning("No files found at {}".format(root))
         return file_list
@@ -394,21 +706,11 @@ class EditTool:
         returns copy of csvs, with "highest versions" only, if applicable
         """
 
-        common_valid = False
-        try:
-            common_compiled = re.compile(self.prefs['group_csv']['common'])
-            common_valid = True
-        except re.error as e:
-            logger.error("Regex pattern error: {}\n{}".format(self.prefs['group_csv']['common'], e))
-        sort_valid = False
-        try:
-            sort_compiled = re.compile(self.prefs['group_csv']['sort'])
-            sort_valid = True
-        except re.error as e:
-            logger.error("Regex pattern error: {}\n{}".format(self.prefs['group_csv']['sort'], e))
+        common_compiled = self._compiled['group_common']
+        sort_compiled = self._compiled['group_sort']
 
         sort_me = {}
-        if common_valid and sort_valid:
+        if common_compiled is not None and sort_compiled is not None:
             for csv_path, one_csv in csvs.items():
                 name = os.path.basename(csv_path)
                 m_c = common_compiled.search(name)
@@ -438,7 +740,10 @@ class EditTool:
         sort_me_sorted = {}
         grouped_csvs = {}
         for group, csv_list in sort_me.items():
-            sort_me_sorted[group] = sorted(csv_list, key=lambda d: d['sort'])
+            if len(csv_list) > 1:
+                sort_me_sorted[group] = sorted(csv_list, key=itemgetter('sort'))
+            else:
+                sort_me_sorted[group] = csv_list
             if self.prefs['group_csv']['highest_only']:
                 last = sort_me_sorted[group][-1]
                 grouped_csvs[last['csv_path']] = csvs[last['csv_path']]
@@ -458,53 +763,6 @@ class EditTool:
         value is the csv contents as a list of dicts
         """
 
-        def is_match_skip(csv_line):
-            filter_matches = 0
-            for one_filter in self.prefs['csv_match_skip']:
-                reg_test = self.regex_test(csv_line.get(one_filter['column']), {}, one_filter['pattern'], one_filter['repl'])
-                if reg_test and reg_test != '':
-                    if one_filter['invert']:
-                        if one_filter['equals'] != '' and one_filter['equals'] != reg_test:
-                            filter_matches += 1
-                    else:
-                        if one_filter['equals'] != '' and one_filter['equals'] == reg_test:
-                            filter_matches += 1
-
-            if filter_matches > 0:
-                return True
-            else:
-                return False
-        def csv_tc_to_frames(one_line) -> dict:
-
-            fps = float(self.prefs['edl']['frame_rate'])
-            out_line = {}
-            tc_columns = ["csv_sin", "csv_sout", "csv_rin", "csv_rout"]
-            for k, v in one_line.items():
-                out_line[k] = v
-                if k in tc_columns:
-                    name = str(k) + '_frames'
-                    if v and v != '':
-                        frames = self.tc_to_frames(v, fps)
-                    else:
-                        frames = None
-                    out_line[name] = frames
-            return out_line
-
-        def rename_columns(one_line) -> dict:
-
-            rename = self.prefs['csv_columns']['rename']
-            target_names = list(rename.keys())
-            csv_names = list(rename.values())
-            out_line = {}
-            for k, v in one_line.items():
-                if k in csv_names:
-                    out_line[target_names[csv_names.index(k)]] = v
-                else:
-                    out_line[k] = v
-                    #one_line[target_names[csv_names.index(k)]] = one_line.pop(k)
-
-            return out_line
-
         csv_files = self.get_file_list(
             root=self.prefs['search_csv']['root_folder'],
             include=self.prefs['search_csv']['filter_include'],
@@ -517,56 +775,60 @@ class EditTool:
             raise EditToolException(f"No csv files found at {self.prefs['search_csv']['root_folder']}")
 
         required_columns = self.prefs['csv_columns']['required']
-        for one_csv in csv_files:
-            one_csv = one_csv.replace('\\', '/')
-            csv_listdict = []
-            valid_lines = 0
-            if one_csv and one_csv != '' and os.path.exists(one_csv):
-                try:
-                    with open(one_csv) as csvfile:
-                        reader = csv.DictReader(csvfile)
-                        for row in reader:
-                            line_dict = dict(row)
-                            line_dict = rename_columns(line_dict)
-                            line_dict = csv_tc_to_frames(line_dict)
-                            line_dict['csv_key'] = '' # for matching
-                            if is_match_skip(line_dict):
-                                line_dict['csv_skip_line'] = True
-                            else:
-                                line_dict['csv_skip_line'] = False
-                                valid_lines += 1
-                            csv_listdict.append(line_dict)
-                except IOError:
-                    logger.error('Error opening csv file {}'.format(one_csv))
+        fps = float(self.prefs['edl']['frame_rate'])
+
+        # filters with empty equals never match, so they are not tested at all
+        skip_filters = []
+        for one_filter in self.prefs['csv_match_skip']:
+            compiled = _compile_cached(one_filter['pattern'])
+            if compiled is not None and one_filter['equals'] != '':
+                skip_filters.append((one_filter['column'], compiled, one_filter['repl'],
+                                     one_filter['invert'], one_filter['equals']))
+        prefs_subset = {
+            'rename': self.prefs['csv_columns']['rename'],
+            'skip_filters': skip_filters,
+            'fps': fps,
+        }
+        csv_files = [one_csv.translate(_SLASH) for one_csv in csv_files]
+        csv_files_size = sum(os.path.getsize(one_csv) for one_csv in csv_files if os.path.isfile(one_csv))
+        if len(csv_files) > 1 and csv_files_size >= _CSV_POOL_MIN_BYTES:
+            # every csv file is read and processed in its own worker process
+            workers = min(len(csv_files), os.cpu_count() or 1)
+            logger.debug("Reading %s csv files in %s processes.", len(csv_files), workers)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_read_one_csv_static, csv_files, itertools.repeat(prefs_subset)))
+        else:
+            results = [_read_one_csv_static(one_csv, prefs_subset) for one_csv in csv_files]
+
+        for one_csv, (csv_listdict, valid_lines) in zip(csv_files, results):
             skip = True
             if csv_listdict and len(csv_listdict) > 0:
                 if valid_lines == 0:
                     logger.warning(f"Csv file {os.path.basename(one_csv)} has no valid lines. Skipping file.")
                 else:
                     skip = False
-                    columns = list(csv_listdict[0].keys())
                     if self.prefs['search_csv']['check_required_columns']:
-                        if not set(required_columns).issubset(columns):
+                        if not set(required_columns).issubset(csv_listdict[0]):
                             skip = True
                             logger.warning(f"Csv file {os.path.basename(one_csv)} is missing required column(s). Skipping file.")
             if not skip:
-                logger.debug(f"Adding csv file {os.path.basename(one_csv)} with {valid_lines} valid lines.")
+                logger.debug("Adding csv file %s with %s valid lines.", os.path.basename(one_csv), valid_lines)
                 csvs[one_csv] = csv_listdict
 
         if csvs is None or csvs == {}:
             raise EditToolException(f"No readable csv files found at {self.prefs['search_csv']['root_folder']}")
         else:
-            logger.info(f"read_csvs -> Found {len(list(csvs.keys()))} Csv file(s).")
+            logger.info("read_csvs -> Found %s Csv file(s).", len(csvs))
 
 
         self.csvs = self._group_csvs(csvs)
-        grouped_csvs_count = len(list(self.csvs.keys()))
-        logger.info(f"read_csvs -> Found {grouped_csvs_count} Csv file(s) after grouping.")
+        grouped_csvs_count = len(self.csvs)
+        logger.info("read_csvs -> Found %s Csv file(s) after grouping.", grouped_csvs_count)
 
         cnt = 0
         for one_csv, lst in self.csvs.items():
             cnt +=1
-            logger.info(f"read_csvs -> {cnt} Csv file :{os.path.basename(one_csv)}")
+            logger.info("read_csvs -> %s Csv file :%s", cnt, os.path.basename(one_csv))
 
     def find_media(self):
         """ Get media data
@@ -591,41 +853,49 @@ class EditTool:
         if media_files is None or len(media_files) == 0:
             raise EditToolException("Folder {} has no media files.".format(self.prefs['search_media']['root_folder']))
 
-        try:
-            _ = re.compile(self.prefs['csv_matching']['media_pattern'])
-        except re.error as e:
-            logger.error("CSV matching media pattern regex error:\n{}".format(e))
+        media_compiled = self._compiled['media_matching']
+        if media_compiled is None:
+            logger.error("CSV matching media pattern regex error.")
             return None
 
+        matched_files = []
         for one_file in media_files:
             result = self.regex_test(self.prefs['csv_matching']['media'],
                                      self.parse_file_name(one_file),
-                                     self.prefs['csv_matching']['media_pattern'],
+                                     media_compiled,
                                      self.prefs['csv_matching']['media_repl'])
             if result is not None and result != '':
-                meta = self.get_metadata(one_file)
+                matched_files.append((result, one_file))
+            else:
+                logger.error(f"find_media -> Failed to get regex result for {os.path.basename(one_file)}")
+
+        # ffprobe runs in parallel, results are collected in file order
+        ffprobe_path = self.prefs['media_meta']['ffprobe_path']
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            futures = [(result, one_file, executor.submit(self.get_metadata, one_file, ffprobe_path))
+                       for result, one_file in matched_files]
+            for result, one_file, future in futures:
+                meta = future.result()
                 if meta is None or meta == {}:
                     meta = {}
                     logger.error(f"Failed to read metadata from file {one_file}")
                 self.media[result] = {'file': one_file, 'metadata': meta}
-            else:
-                logger.error(f"find_media -> Failed to get regex result for {os.path.basename(one_file)}")
 
         if self.media is not None and self.media != {}:
-            logger.info(f"find_media -> Found {len(list(self.media.keys()))} media file(s).")
+            logger.info("find_media -> Found %s media file(s).", len(self.media))
 
         return self.media
 
     def prep_matching(self):
         """
         Runs regex on every csv line
+        Indexes the not skipped lines by their csv_key for csv_matching
         """
 
-        # reset matching
-        for csv_file, one_csv in self.csvs.items():
-            for one_line in one_csv:
-                one_line['csv_key'] = ''
-
+        self._key_index = {}
+        column = self.prefs['csv_matching']['column']
+        csv_compiled = self._compiled['csv_matching']
+        csv_repl = self.prefs['csv_matching']['csv_repl']
         for csv_file, one_csv in self.csvs.items():
             cnt = 0
             for one_line in one_csv:
@@ -637,11 +907,10 @@ class EditTool:
                 # skip line
                 if one_line['csv_skip_line']:
                     continue
-                result = self.regex_test(one_line.get(self.prefs['csv_matching']['column']), {},
-                                         self.prefs['csv_matching']['csv_pattern'],
-                                         self.prefs['csv_matching']['csv_repl'])
+                result = regex_test_notokens(one_line.get(column), csv_compiled, csv_repl)
                 if result is not None and result != '':
                     one_line['csv_key'] = result
+                    self._key_index.setdefault(result, []).append((csv_file, cnt, one_line))
 
         return self.csvs
 
@@ -668,44 +937,49 @@ class EditTool:
         media_not_matched = []
         for media_key, media_dict in self.media.items():
             found = False
-            for csv_file, one_csv in self.csvs.items():
-                cnt = 0
-                for one_line in one_csv:
-                    cnt += 1
-                    # check if skip line due to skip filters
-                    if one_line['csv_skip_line']:
-                        continue
-                    if one_line['csv_key'] == media_key:
-                        if match_tc:
-                            tc_ok = is_tc_matching(one_line['csv_sin_frames'], media_dict['metadata']['tc_in_frames'], one_line['csv_sout_frames'], media_dict['metadata']['tc_out_frames'])
-                        else:
-                            tc_ok = True
-                        if tc_ok:
-                            media_dict['csv_line'] = one_line
-                            media_dict['csv_file'] = csv_file
-                            one_line['csv_matched_media'] = media_dict['file']
-                            found = True
-                            matched_media_counter += 1
-                            logger.debug(f"csv_matching -> Found matching csv line for {os.path.basename(media_dict['file'])} at {os.path.basename(csv_file)} line {cnt}")
-                            # first found media is enough
-                            break
-                        else:
-                            if match_tc:
-                                logger.debug(f"csv_matching -> Csv line for {os.path.basename(media_dict['file'])} at {os.path.basename(csv_file)} line {cnt} not matching timecode.")
-                if found:
+            # skipped lines are not in the index
+            for csv_file, cnt, one_line in self._key_index.get(media_key, ()):
+                if match_tc:
+                    tc_ok = is_tc_matching(one_line['csv_sin_frames'], media_dict['metadata'].get('tc_in_frames'), one_line['csv_sout_frames'], media_dict['metadata'].get('tc_out_frames'))
+                else:
+                    tc_ok = True
+                if tc_ok:
+                    media_dict['csv_line'] = one_line
+                    media_dict['csv_file'] = csv_file
+                    one_line['csv_matched_media'] = media_dict['file']
+                    found = True
+                    matched_media_counter += 1
+                    logger.debug("csv_matching -> Found matching csv line for %s at %s line %s", os.path.basename(media_dict['file']), os.path.basename(csv_file), cnt)
                     # first found media is enough
                     break
+                else:
+                    logger.debug("csv_matching -> Csv line for %s at %s line %s not matching timecode.", os.path.basename(media_dict['file']), os.path.basename(csv_file), cnt)
             if not found:
-                logger.debug(f"csv_matching -> Matching csv line for the media file {media_key} not found.")
+                logger.debug("csv_matching -> Matching csv line for the media file %s not found.", media_key)
                 media_not_matched.append(media_dict['file'])
 
-        logger.info(f"csv_matching -> Matched {matched_media_counter}  from {len(list(self.media.keys()))} media files")
+        logger.info("csv_matching -> Matched %s  from %s media files", matched_media_counter, len(self.media))
         if len(media_not_matched) > 0:
             logger.warning(f"csv_matching -> {len(media_not_matched)} media not matched to csv")
-            logger.info(f"{pprint.pformat(media_not_matched)}")
+            logger.info(pprint.pformat(media_not_matched))
 
     def matched_media_to_edls(self):
 
+        # prefs are the same for every edl line, media_to_edl_line only uses these locals
+        regex_test = self.regex_test
+        max_reel = self.prefs['edl']['max_reel']
+        clip_export = self.prefs['edl_clip']['export']
+        clip_path_export = self.prefs['edl_clip_path']['export']
+        reel_source = self.prefs['edl_reel']['source']
+        reel_compiled = self._compiled['edl_reel']
+        reel_repl = self.prefs['edl_reel']['repl']
+        clip_source = self.prefs['edl_clip']['source']
+        clip_compiled = self._compiled['edl_clip']
+        clip_repl = self.prefs['edl_clip']['repl']
+        clip_path_source = self.prefs['edl_clip_path']['source']
+        clip_path_compiled = self._compiled['edl_clip_path']
+        clip_path_repl = self.prefs['edl_clip_path']['repl']
+
         def media_to_edl_line(one_media, line_number):
 
             number = str(line_number).zfill(3) + '  '
@@ -713,32 +987,27 @@ class EditTool:
             tcs = one_media['csv_line']['csv_sin'] + ' ' + one_media['csv_line']['csv_sout'] + ' ' + \
                   one_media['csv_line']['csv_rin'] + ' ' + one_media['csv_line']['csv_rout']
 
-            tokens = dict(one_media['csv_line'])
-            tokens.update(one_media['metadata'])
-            tokens['media_path'] = one_media['file']
-            tokens['media_file'] = os.path.basename(one_media['file'])
-            tokens['media_key'] = one_media['media_key']
+            # one tokens dict per media, shared by all three regexes
+            tokens = {**one_media['csv_line'], **one_media['metadata'],
+                      'media_path': one_media['file'],
+                      'media_file': os.path.basename(one_media['file']),
+                      'media_key': one_media['media_key']}
 
-            reel = self.regex_test(self.prefs['edl_reel']['source'], tokens, self.prefs['edl_reel']['pattern'],
-                                   self.prefs['edl_reel']['repl'])
+            reel = regex_test(reel_source, tokens, reel_compiled, reel_repl)
             if reel is None or reel == '':
                 reel = 'AX'
-            reel = reel + (' ' * (self.prefs['edl']['max_reel'] - len(reel)))
-            reel += ' '
+            reel = reel.ljust(max_reel) + ' '
 
-            fcm = self.regex_test(self.prefs['edl_clip']['source'], tokens, self.prefs['edl_clip']['pattern'],
-                                   self.prefs['edl_clip']['repl'])
+            frags = [number, reel, vc, tcs, '\n']
+            # remark regexes only run for exported remark lines
+            if clip_export:
+                fcm = regex_test(clip_source, tokens, clip_compiled, clip_repl)
+                frags.append(fcm + '\n')
+            if clip_path_export:
+                fp = regex_test(clip_path_source, tokens, clip_path_compiled, clip_path_repl)
+                frags.append(fp + '\n')
 
-            fp = self.regex_test(self.prefs['edl_clip_path']['source'], tokens, self.prefs['edl_clip_path']['pattern'],
-                                   self.prefs['edl_clip_path']['repl'])
-
-            line = number + reel + vc + tcs + '\n'
-            if self.prefs['edl_clip']['export']:
-                line += fcm + '\n'
-            if self.prefs['edl_clip_path']['export']:
-                line += fp + '\n'
-
-            return line
+            return ''.join(frags)
 
         # media has media_key: {csv_file, file, metadata, csv_line}
         # csv_file: path to csv
@@ -747,66 +1016,100 @@ class EditTool:
         # metadata: dict with tc, width, height, par, duration frames ...
 
         # rearrange to dict with key being the csv file, value list of dicts
-        by_csv = {}
+        by_csv = defaultdict(list)
         for media_key, media_dict in self.media.items():
-            my_media = media_dict
-            my_media['media_key'] = media_key
-            _f = media_dict.get('csv_file')
-            _exists = by_csv.get(_f)
-            if _exists and _f:
-                by_csv[_f].append(my_media)
-            else:
-                by_csv[_f] = [my_media]
+            media_dict['media_key'] = media_key
+            by_csv[media_dict.get('csv_file')].append(media_dict)
+        # media without matching csv line do not go to any edl
+        not_matched = by_csv.pop(None, [])
+        if not_matched:
+            logger.info("Skipped %s media file(s) without matching csv line.", len(not_matched))
 
         if self.prefs['edl']['drop_frame']:
             fcm = 'FCM: DROP FRAME\n\n'
         else:
             fcm = 'FCM: NON-DROP FRAME\n\n'
 
+        custom_folder = self.prefs['edl']['custom_folder'].translate(_SLASH)
         matched_media_count = 0
+        # edls usually share few folders, every folder is created once
+        created_dirs = set()
         for one_csv, medias in by_csv.items():
-            if one_csv is None:
-                continue
-            sorted_medias = sorted(medias, key=lambda d: d.get('csv_line', {}).get('csv_rin_frames'))
+            # every media grouped under a csv has its matched csv_line
+            sorted_medias = sorted(medias, key=lambda d: d['csv_line']['csv_rin_frames'])
 
             # edl folder:
-            edl_root = self.prefs['edl']['custom_folder'].replace('\\', '/')
-            first_media_path = os.path.dirname(sorted_medias[0]['file']).replace('\\', '/')
+            first_media_dir = PurePosixPath(sorted_medias[0]['file'].translate(_SLASH)).parent
             if self.prefs['edl']['use_media_root']:
-                edl_root = first_media_path
+                edl_root = str(first_media_dir)
             elif self.prefs['edl']['use_media_root_up']:
-                edl_root = '/'.join(first_media_path.split('/')[:-1])
-            logger.debug(f"The EDL root is {edl_root}")
+                edl_root = str(first_media_dir.parent)
+            else:
+                edl_root = custom_folder
+            logger.debug("The EDL root is %s", edl_root)
 
             # edl name:
             edl_name = self.prefs['edl']['edl_name_custom']
             if self.prefs['edl']['edl_name_from_csv']:
-                edl_name = os.path.basename(one_csv)[:-4]
+                edl_name = os.path.splitext(os.path.basename(one_csv))[0]
             elif self.prefs['edl']['edl_name_from_media_folder']:
-                edl_name = first_media_path.split('/')[-1]
+                edl_name = first_media_dir.name
             edl_name = self.prefs['edl']['edl_name_prefix'] + edl_name + self.prefs['edl']['edl_name_suffix']
-            logger.debug(f"The EDL root is {edl_name}")
-
-            header = f"TITLE: {edl_name}\n" + fcm
-            cnt = 0
-            lines = header
-            for one_media in sorted_medias:
-                cnt += 1
-                matched_media_count += 1
-                lines += media_to_edl_line(one_media, cnt)
+            logger.debug("The EDL name is %s", edl_name)
 
-            edl_path = edl_root + '/' + edl_name + '.edl'
-            self.edls[edl_path] = lines
+            header = f"TITLE: {edl_name}\n{fcm}"
+            edl_path = f"{edl_root}/{edl_name}.edl"
+            matched_media_count += len(sorted_medias)
 
-        logger.info(f"Generated {len(self.edls.keys())} EDL(s), with {matched_media_count} media files.")
-        for edl_file, edl_content in self.edls.items():
+            # edl lines are written as they are generated, no edl is kept in memory
+            # the temporary file replaces the edl only when complete, so no half written edl is left
+            cnt = 0
+            tmp_path = edl_path + '.tmp'
             try:
-                os.makedirs(os.path.dirname(edl_file), exist_ok=True)
-                with open(edl_file, 'w') as f:
-                    f.write(edl_content)
-                logger.info(f"Created edl {edl_file}.")
+                edl_dir = os.path.dirname(edl_path)
+                if edl_dir not in created_dirs:
+                    os.makedirs(edl_dir, exist_ok=True)
+                    created_dirs.add(edl_dir)
+                with open(tmp_path, 'w', buffering=1 << 20) as f:
+                    f.write(header)
+                    for one_media in sorted_medias:
+                        cnt += 1
+                        f.write(media_to_edl_line(one_media, cnt))
+                os.replace(tmp_path, edl_path)
+                self.edls[edl_path] = cnt
+                logger.info("Created edl %s.", edl_path)
             except Exception as e:
-                logger.error(f"Failed to write edl {edl_file}.\n{e}")
+                # one failed edl is logged, the other csv groups are still exported
+                logger.error(f"Failed to write edl {edl_path}.\n{e}")
+            finally:
+                # temporary file is left only if writing failed
+                if os.path.exists(tmp_path):
+                    try:
+                        os.remove(tmp_path)
+                    except OSError as e:
+                        logger.warning(f"Failed to remove temporary file {tmp_path}.\n{e}")
+
+        logger.info("Generated %s EDL(s), with %s media files.", len(self.edls), matched_media_count)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_prefs(pth, script_path, mtime_ns):
+    """ reads prefs json file and resolves paths to external tools
+
+    mtime_ns is part of the cache key only, so edited prefs file is read again
+    the returned dict is shared by all callers, get_prefs hands out copies
+    """
+    with open(pth, 'r') as json_data:
+        prefs = json.load(json_data)
+
+    for key in ('ffprobe_path', 'oiio_path'):
+        tool_path = prefs['media_meta'][key]
+        if tool_path.startswith('./'):
+            tool_path = os.path.join(script_path, tool_path[2:])
+        if _IS_WINDOWS and not tool_path.lower().endswith('.exe'):
+            tool_path += '.exe'
+        prefs['media_meta'][key] = tool_path
+    return prefs
 
 
 def main() -> None:
@@ -832,28 +1135,25 @@ def main() -> None:
             type=str,
             required=False
         )
+        parser.add_argument(
+            '-j', '--jobs',
+            help="Number of parallel media metadata reads. Defaults to twice the cpu count.",
+            type=int,
+            required=False
+        )
         return parser.parse_args()
 
     def get_prefs(pth, script_path):
         prefs = {}
         try:
-            with open(pth, 'r') as json_data:
-                prefs = json.load(json_data)
-
-            fp = prefs['media_meta']['ffprobe_path']
-            if fp.startswith('./'):
-                prefs['media_meta']['ffprobe_path'] = script_path + fp[1:]
-            if platform.system() == 'Windows' and not fp.endswith('.exr'):
-                prefs['media_meta']['ffprobe_path'] += '.exe'
+            # parsed prefs are cached until the file changes, the copy can be modified freely
+            prefs = copy.deepcopy(_load_prefs(pth, script_path, os.stat(pth).st_mtime_ns))
+
             if not os.path.exists(prefs['media_meta']['ffprobe_path']):
-                logger.error(f"Ffprobe not found at {prefs['media_meta']['ffprobe_path']}, exiting")
-                exit(1)
-
-            op = prefs['media_meta']['oiio_path']
-            if op.startswith('./'):
-                prefs['media_meta']['oiio_path'] = script_path + op[1:]
-            if platform.system() == 'Windows' and not op.endswith('.exr'):
-                prefs['media_meta']['oiio_path'] += '.exe'
+                if av is None:
+                    logger.error(f"Ffprobe not found at {prefs['media_meta']['ffprobe_path']}, exiting")
+                    exit(1)
+                logger.debug("Ffprobe not found at %s, using PyAV.", prefs['media_meta']['ffprobe_path'])
             if not os.path.exists(prefs['media_meta']['oiio_path']):
                 logger.error("OiioTool not found at {}.".format(prefs['media_meta']['oiio_path']))
         except Exception as e:
@@ -880,10 +1180,10 @@ def main() -> None:
     search_media_root = args.get('m')
     if search_media_root:
         prefs['search_media']['root_folder'] = search_media_root
-    logger.info(f"Staring with media at \n{prefs['search_media']['root_folder']}\nwith csvs at\n{prefs['search_csv']['root_folder']}\n")
+    logger.info("Staring with media at \n%s\nwith csvs at\n%s\n", prefs['search_media']['root_folder'], prefs['search_csv']['root_folder'])
 
     try:
-        tool = EditTool(prefs, script_path)
+        tool = EditTool(prefs, script_path, jobs=args.get('jobs'))
         tool.read_csvs()
         tool.find_media()
         tool.prep_matching()
@@ -894,5 +1194,7 @@ def main() -> None:
         exit(1)
 
 if __name__ == "__main__":
+    # needed by csv worker processes in frozen windows executables
+    multiprocessing.freeze_support()
     main()
 